@@ -1,9 +1,31 @@
 import os
+import glob
+import functools
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pandas import DataFrame
+from pathlib import Path
 import json
 
 
+@functools.lru_cache(maxsize=64)
+def _find_segy_file(data_directory: str, file_name: str) -> str:
+    """
+    Resolves a SEG-Y base name to its .sgy or .segy path with a single directory read.
+    Only found paths are cached; a FileNotFoundError is raised (and not cached) otherwise.
+    """
+    found = {
+        path.name for path in Path(data_directory).glob(f"{glob.escape(file_name)}.s*gy") if path.is_file()
+    }
+    for ext in [".sgy", ".segy"]:
+        if f"{file_name}{ext}" in found:
+            return os.path.join(data_directory, f"{file_name}{ext}")
+    raise FileNotFoundError(
+        f"No SEG-Y file found for '{file_name}' with .sgy or .segy extension in {data_directory}.")
+
+
 class FileHandler:
     def __init__(self, data_directory: str = "./data"):
         """Initialize with the directory containing CSV files."""
@@ -29,11 +51,28 @@ class FileHandler:
         except Exception as e:
             raise Exception(f"Error writing DataFrame to CSV file: {str(e)}")
 
-    def read_parquet(self, file_name: str) -> DataFrame:
-        """Read a Parquet file and return its contents as a DataFrame."""
+    def read_parquet(self, file_name: str, columns: list[str] | None = None) -> DataFrame:
+        """
+        Read a Parquet file and return its contents as a DataFrame.
+
+        If columns is given, only those columns are decoded; requested columns missing from the file are skipped.
+        """
+        try:
+            file_path = os.path.join(self.data_directory, file_name)
+            if columns is not None:
+                available_columns = set(pq.read_schema(file_path).names)
+                columns = [column for column in columns if column in available_columns]
+            return pd.read_parquet(file_path, columns=columns)
+        except FileNotFoundError:
+            raise Exception(f"File {file_path} not found.")
+        except Exception as e:
+            raise Exception(f"Error reading Parquet file: {str(e)}")
+
+    def get_parquet_row_count(self, file_name: str) -> int:
+        """Get the number of rows of a Parquet file from its metadata, without reading any column."""
         try:
             file_path = os.path.join(self.data_directory, file_name)
-            return pd.read_parquet(file_path)
+            return pq.read_metadata(file_path).num_rows
         except FileNotFoundError:
             raise Exception(f"File {file_path} not found.")
         except Exception as e:
@@ -48,6 +87,53 @@ class FileHandler:
             raise Exception(
                 f"Error writing DataFrame to Parquet file: {str(e)}")
 
+    def read_parquet_with_amplitudes(self, file_name: str) -> tuple[DataFrame, np.ndarray]:
+        """
+        Read a Parquet file written by to_parquet_with_amplitudes.
+
+        Parameters:
+          file_name (str): The name of the Parquet file (with extension).
+
+        Returns:
+          tuple[DataFrame, np.ndarray]: The DataFrame without the "Amplitudes" column, and a read-only 2-D array
+                 with the amplitudes of each row, taken from the Arrow buffer without copying.
+        """
+        try:
+            file_path = os.path.join(self.data_directory, file_name)
+            table = pq.read_table(file_path)
+            amplitudes_column = table.column("Amplitudes").combine_chunks()
+            amplitudes = amplitudes_column.flatten().to_numpy().reshape(
+                len(amplitudes_column), amplitudes_column.type.list_size)
+            columns = [name for name in table.column_names if name != "Amplitudes"]
+            return table.select(columns).to_pandas(), amplitudes
+        except FileNotFoundError:
+            raise Exception(f"File {file_path} not found.")
+        except Exception as e:
+            raise Exception(f"Error reading Parquet file: {str(e)}")
+
+    def to_parquet_with_amplitudes(self, df: DataFrame, amplitudes: np.ndarray, file_name: str) -> None:
+        """
+        Write a DataFrame and its amplitudes to a Parquet file.
+
+        The amplitudes are stored as an Arrow fixed-size list column, so they are written and read back as one
+        contiguous buffer instead of one variable-length list per row.
+
+        Parameters:
+          df (DataFrame): The DataFrame to write.
+          amplitudes (np.ndarray): A 2-D array with the amplitudes of each DataFrame row.
+          file_name (str): The name of the Parquet file (with extension).
+        """
+        try:
+            file_path = os.path.join(self.data_directory, file_name)
+            values = pa.array(np.ascontiguousarray(amplitudes).ravel())
+            amplitudes_column = pa.FixedSizeListArray.from_arrays(values, amplitudes.shape[1])
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.append_column("Amplitudes", amplitudes_column)
+            pq.write_table(table, file_path, compression="zstd")
+        except Exception as e:
+            raise Exception(
+                f"Error writing DataFrame to Parquet file: {str(e)}")
+
     def get_columns_from_parquet(self, file_name: str) -> list:
         """Get the column names from a Parquet file."""
         try:
@@ -69,14 +155,11 @@ class FileHandler:
 
         Raises:
           FileNotFoundError: If neither .sgy nor .segy file exists.
+
+        Notes:
+          - Resolved paths are cached per (data_directory, file_name), so repeated lookups skip the filesystem.
         """
-        possible_extensions = [".sgy", ".segy"]
-        for ext in possible_extensions:
-            file_path = os.path.join(self.data_directory, f"{file_name}{ext}")
-            if os.path.isfile(file_path):
-                return file_path
-        raise FileNotFoundError(
-            f"No SEG-Y file found for '{file_name}' with .sgy or .segy extension in {self.data_directory}.")
+        return _find_segy_file(self.data_directory, file_name)
 
     def file_exists(self, file_name: str) -> bool:
         """
@@ -92,6 +175,22 @@ class FileHandler:
             return True
         return False
 
+    def is_up_to_date(self, file_path: str, source_path: str) -> bool:
+        """
+        Check if a file derived from a source file exists and is not older than the source.
+
+        Parameters:
+          file_path (str): The full path of the derived file (e.g. a Parquet or JSON cache).
+          source_path (str): The full path of the file it was derived from (e.g. the SEG-Y file).
+
+        Returns:
+          bool: True if the derived file exists and its modification time is not older than the source's,
+                False otherwise.
+        """
+        if not os.path.isfile(file_path):
+            return False
+        return os.path.getmtime(file_path) >= os.path.getmtime(source_path)
+
     def remove_file(self, file_name: str) -> None:
         """
         Remove a file from the data directory.
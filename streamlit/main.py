@@ -1,16 +1,60 @@
 import os
 import time
+import orjson
 import numpy as np
 import plotly.graph_objects as go
 import matplotlib.pyplot as plt
 import streamlit as st
 from matplotlib import colormaps
-from plotly.io import write_json
-from plotly.io import read_json
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from segy_handler import SegyHandler
 from file_handler import FileHandler
+from seismic_plotter import build_colorscale, build_section_figure
+
+
+# cache_resource rather than functools.lru_cache: Streamlit re-executes this module on every rerun
+_build_colorscale = st.cache_resource(show_spinner=False)(build_colorscale)
+
+
+# The SEG-Y modification time is part of the cache key, so replacing the file misses the cache;
+# SegyHandler then rebuilds its Parquet and JSON caches, which are older than the new file
+@st.cache_data(show_spinner=False)
+def load_segy_statistics(data_directory: str, file_name: str, mtime: float) -> dict:
+    segy_handler = SegyHandler(data_directory=data_directory, available_segy_files=[file_name])
+    return segy_handler.process_segy_file(file_name)
+
+
+@st.cache_data(show_spinner=False)
+def load_segy(data_directory: str, file_name: str, mtime: float) -> tuple:
+    segy_handler = SegyHandler(data_directory=data_directory, available_segy_files=[file_name])
+    return segy_handler.read_segy(file_name)
+
+
+@st.cache_resource
+def get_figure_writer() -> ThreadPoolExecutor:
+    # A single long-lived writer thread, shared across Streamlit reruns
+    return ThreadPoolExecutor(max_workers=1)
+
+
+def _contiguous_array(obj):
+    # orjson hands non-C-contiguous arrays (such as transposed views) to default instead of serializing them
+    if isinstance(obj, np.ndarray):
+        return np.ascontiguousarray(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def save_figure_json(fig: go.Figure, save_path: str) -> None:
+    with open(save_path, "wb") as f:
+        f.write(orjson.dumps(fig.to_plotly_json(), default=_contiguous_array, option=orjson.OPT_SERIALIZE_NUMPY))
+
+
+def report_figure_save(future: Future, save_path: str) -> None:
+    # Runs on the writer thread, outside the Streamlit script context, so the error is printed rather than shown
+    error = future.exception()
+    if error is not None:
+        print(f"Error saving graphic '{save_path}': {error}")
 
 
 def read_and_plot():
@@ -22,11 +66,13 @@ def read_and_plot():
         available_segy_files=["jequitinhonha"] 
     )
 
-    results = segy_handler.process_segy_file("jequitinhonha")
+    mtime = os.path.getmtime(segy_handler.get_segy_file_path("jequitinhonha"))
+
+    results = load_segy_statistics(segy_handler.data_directory, "jequitinhonha", mtime)
     
     file_info = results["jequitinhonha"]
     
-    df = segy_handler.read_segy("jequitinhonha")
+    df, amplitudes = load_segy(segy_handler.data_directory, "jequitinhonha", mtime)
     
     #df_filtered = df[(df['CDP'] >= 1700) & df['CDP'] <= 1800]
 
@@ -44,13 +90,10 @@ def read_and_plot():
     trace_sample_count = df["TRACE_SAMPLE_COUNT"].iloc[0]
     trace_sample_interval = df["TRACE_SAMPLE_INTERVAL"].iloc[0]
 
-    # Compute amplitude matrix and time-related parameters
-    amplitudes = np.vstack(df["Amplitudes"].values)
+    # Compute time-related parameters
     dt_ms = trace_sample_interval / 1000  # Convert interval to milliseconds
-    duration_sec = (trace_sample_count * dt_ms) / \
-        1000  # Total duration in seconds
 
-    # Generate trace_number array starting from trace_start, incremented by trace_increment, with length equal to number of rows in df
+    # Generate trace_number array starting from trace_start, incremented by 1, with length equal to number of rows in df
     if "TRACE_SEQUENCE_FILE" in df.columns:
         trace_start = df["TRACE_SEQUENCE_FILE"].iloc[0]
     elif "TRACE_SEQUENCE_LINE" in df.columns:
@@ -58,38 +101,18 @@ def read_and_plot():
     else:
         trace_start = 1
 
-    trace_increment = 1
-    trace_number = np.arange(trace_start, trace_start + trace_increment * len(df), trace_increment)
+    trace_number = np.arange(trace_start, trace_start + len(df), dtype=np.int32)
 
-    # Time samples in seconds
-    time_samples = np.linspace(0, duration_sec, trace_sample_count)
+    # Time samples in seconds, built from integer sample indices so the axis has exactly trace_sample_count points
+    time_samples = np.arange(trace_sample_count, dtype=np.float32) * np.float32(dt_ms / 1000)
 
     x_min, x_max = trace_number[0], trace_number[-1]
 
-    norm_amplitudes = amplitudes / np.max(np.abs(amplitudes))
-
-    cmap = plt.get_cmap(colormap)
-    colorscale = [
-        [i / 255, f"rgb({int(r*255)}, {int(g*255)}, {int(b*255)})"]
-        for i in range(256)
-        for r, g, b, _ in [cmap(i / 255)]
-    ]
-
-
-    fig = go.Figure(data=go.Heatmap(
-        z=norm_amplitudes.T,
-        x=trace_number,
-        y=time_samples,
-        colorscale=colorscale,
-        zsmooth='best', # Applies bilinear interpolation for smoother visualization (equivalent to Seismic Unix Ximage)
-        zmid=0,
-        colorbar=dict(
-            title=color_title,
-            tickfont=dict(size=14),
-            thickness=30,
-            len=1,
-        )
-    ))
+    lut, colorscale = _build_colorscale(colormap)
+    fig = build_section_figure(
+        amplitudes, trace_number, time_samples, dt_ms, lut, colorscale, color_title, show_seismic,
+        parallel=False, # Streamlit sessions call this from their own script threads
+    )
 
     fig.update_layout(
         title=dict(
@@ -100,6 +123,7 @@ def read_and_plot():
         yaxis_title=y_title,
         yaxis=dict(
             autorange="reversed",
+            scaleanchor=False, # Image traces would otherwise force square pixels
             showgrid=False,
             title=dict(
                 font=dict(size=18)
@@ -122,17 +146,16 @@ def read_and_plot():
     save_path = os.path.join(
     "./data", f"{time.time()}_seismic_section.json")
     os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    write_json(fig, save_path)
+
+    # Persist the figure in the background and render the in-memory figure instead of reading it back
+    get_figure_writer().submit(save_figure_json, fig, save_path).add_done_callback(
+        lambda future: report_figure_save(future, save_path))
 
     try:
-      if isinstance(save_path, str) and os.path.exists(save_path):
-        loaded_fig = read_json(save_path)
-        chart_key = Path(save_path).stem
-        st.plotly_chart(loaded_fig, width="stretch", key=chart_key)
-      else:
-        raise FileNotFoundError(f"Visualization file not found")
+      chart_key = Path(save_path).stem
+      st.plotly_chart(fig, width="stretch", key=chart_key)
     except Exception as e:
-      st.error(f"Error loading graphic '{save_path}': {str(e)}")
+      st.error(f"Error displaying graphic '{save_path}': {str(e)}")
 
     end_time = time.perf_counter()
     st.session_state.last_run = end_time - start_time
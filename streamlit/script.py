@@ -27,7 +27,7 @@ def read_and_plot():
     
     file_info = results["0258-6089"]
     
-    df = segy_handler.read_segy("0258-6089")
+    df, amplitudes = segy_handler.read_segy("0258-6089")
     
     #df_filtered = df[(df['CDP'] >= 1700) & df['CDP'] <= 1800]
 
@@ -43,8 +43,7 @@ def read_and_plot():
     trace_sample_count = df["TRACE_SAMPLE_COUNT"].iloc[0]
     trace_sample_interval = df["TRACE_SAMPLE_INTERVAL"].iloc[0]
 
-    # Compute amplitude matrix and time-related parameters
-    amplitudes = np.vstack(df["Amplitudes"].values)
+    # Compute time-related parameters
     dt_ms = trace_sample_interval / 1000  # Convert interval to milliseconds
     duration_sec = (trace_sample_count * dt_ms) / \
         1000  # Total duration in seconds
@@ -5,7 +5,6 @@ import pandas as pd
 import json
 from pandas import DataFrame
 from segysak.segy import get_segy_texthead
-from segysak.segy import segy_header_scan
 from segysak.segy import segy_header_scrape
 from file_handler import FileHandler
 from segy_info_extractor import SegyInfoExtractor
@@ -32,12 +31,12 @@ class SegyHandler(FileHandler):
         parquet_file_path = os.path.join(
             self.data_directory, f"{current_file}.parquet")
         
-        if not os.path.exists(parquet_file_path):
-            # Extract headers if the parquet doesn't exist yet
-            if current_file == original_segy_file_name:
+        if current_file == original_segy_file_name:
+            # Extract headers if the parquet doesn't exist yet or is older than the SEG-Y file
+            if not self.is_up_to_date(parquet_file_path, self.get_segy_file_path(original_segy_file_name)):
                 self.__extract_segy_trace_headers(current_file)
-            else:
-                raise ValueError(f"Parquet file for {current_file} missing.")
+        elif not os.path.exists(parquet_file_path):
+            raise ValueError(f"Parquet file for {current_file} missing.")
 
         # Get statistics (this returns columns, info text, and scalars)
         return self.get_seismic_statistics(current_file)
@@ -63,38 +62,47 @@ class SegyHandler(FileHandler):
         segy_headers_df = self.read_segy_headers(file_name)
         self.to_parquet(segy_headers_df, f"{file_name}.parquet")
 
-    def read_segy(self, file_name: str) -> DataFrame:
+    def read_segy(self, file_name: str) -> tuple[DataFrame, np.ndarray]:
         """
-        Reads a SEG-Y file and returns its trace headers and amplitudes as a DataFrame.
+        Reads a SEG-Y file and returns its trace headers and amplitudes.
 
         Parameters:
           file_name (str): The base name of the SEG-Y file (without extension) to read from the data directory.
 
         Returns:
-          DataFrame: A DataFrame containing the trace headers for each trace, with an additional "Amplitudes" column
-                 containing the amplitude values for each trace.
+          tuple[DataFrame, np.ndarray]: A DataFrame containing the trace headers for each trace, and a contiguous
+                 float32 array of shape (tracecount, sample_count) with the amplitudes of each trace, row-aligned
+                 with the DataFrame.
 
         Notes:
           - The method expects the SEG-Y file to have a '.sgy' extension and be located in self.data_directory.
-          - Uses segy_header_scan and segy_header_scrape to extract and filter trace headers.
-          - Amplitudes are extracted for each trace and appended as a new column in the DataFrame.
+          - Uses segy_header_scrape to extract the trace headers and drops the all-zero ones, unless the headers
+            parquet written by process_segy_file exists and is newer than the SEG-Y file.
+          - Amplitudes are extracted for all traces at once into a single 2-D array.
+          - The result is cached as '<file_name>_full.parquet' in self.data_directory and read back from there
+            on subsequent calls, until the SEG-Y file is modified after the cache was written.
         """
+        cache_file_name = f"{file_name}_full.parquet"
+
         try:
             segy_file_path = self.get_segy_file_path(file_name)
-            with segyio.open(segy_file_path, "r", ignore_geometry=True) as segyfile:
-                # Extract trace headers into a DataFrame
-                scan = segy_header_scan(segy_file_path)
-                segy_df = segy_header_scrape(segy_file_path, partial_scan=None)
-                segy_df = segy_df[scan[scan["mean"] != 0].index]
-
-                # Extract amplitudes for each trace
-                amplitudes = [segyfile.trace[i]
-                              for i in range(segyfile.tracecount)]
+            if self.is_up_to_date(os.path.join(self.data_directory, cache_file_name), segy_file_path):
+                return self.read_parquet_with_amplitudes(cache_file_name)
 
-                # Add amplitudes as a new column
-                segy_df["Amplitudes"] = amplitudes
-
-                return segy_df
+            with segyio.open(segy_file_path, "r", ignore_geometry=True) as segyfile:
+                # Extract trace headers into a DataFrame, reusing the headers parquet when it is up to date
+                headers_file_name = f"{file_name}.parquet"
+                if self.is_up_to_date(os.path.join(self.data_directory, headers_file_name), segy_file_path):
+                    segy_df = self.read_parquet(headers_file_name).drop(columns="trace_index")
+                else:
+                    segy_df = segy_header_scrape(segy_file_path, partial_scan=None)
+                    segy_df = segy_df.loc[:, (segy_df != 0).any(axis=0)]
+
+                # Extract the amplitudes of all traces in a single bulk read
+                amplitudes = np.ascontiguousarray(segyfile.trace.raw[:], dtype=np.float32)
+
+            self.to_parquet_with_amplitudes(segy_df, amplitudes, cache_file_name)
+            return segy_df, amplitudes
         except FileNotFoundError:
             raise Exception(
                 f"File {file_name} not found in {self.data_directory}.")
@@ -103,16 +111,14 @@ class SegyHandler(FileHandler):
 
     def read_segy_headers(self, file_name: str) -> DataFrame:
         segy_file_path = self.get_segy_file_path(file_name)
-        with segyio.open(segy_file_path, "r", ignore_geometry=True) as segyfile:
-            scan = segy_header_scan(segy_file_path)
-            trace_headers_df = segy_header_scrape(segy_file_path, partial_scan=None)
-            
-            # Filter non-zero headers
-            trace_headers_df = trace_headers_df[scan[scan["mean"] != 0].index]
-            trace_headers_df.reset_index(drop=True, inplace=True)
-            trace_headers_df["trace_index"] = trace_headers_df.index
+        trace_headers_df = segy_header_scrape(segy_file_path, partial_scan=None)
+
+        # Filter non-zero headers in memory instead of scanning the file a second time
+        trace_headers_df = trace_headers_df.loc[:, (trace_headers_df != 0).any(axis=0)]
+        trace_headers_df.reset_index(drop=True, inplace=True)
+        trace_headers_df["trace_index"] = trace_headers_df.index
 
-            return trace_headers_df
+        return trace_headers_df
 
     def __save_segy_text_header_as_txt(self, file_name: str):
         txt_file_path = os.path.join(self.data_directory, f"{file_name}.txt")
@@ -130,10 +136,13 @@ class SegyHandler(FileHandler):
 
     def get_seismic_statistics(self, current_file: str) -> dict:
         json_filename = f"{current_file}.json"
-        json_data = self.load_segy_from_json(json_filename) 
-        
-        if json_data is not None:
-            return json_data
+        segy_file_path = self.get_segy_file_path(self.get_segy_base_name(current_file))
+
+        # Statistics saved before the SEG-Y file was last modified are recomputed
+        if self.is_up_to_date(self.get_json_filepath(json_filename), segy_file_path):
+            json_data = self.load_segy_from_json(json_filename)
+            if json_data is not None:
+                return json_data
             
         columns = self.get_columns_from_parquet(f"{current_file}.parquet")
         columns = [col for col in columns if col.lower() not in ("amplitude", "amplitudes", "trace_index")]
@@ -164,9 +173,12 @@ class SegyHandler(FileHandler):
         original_segy_file_name = self.get_segy_base_name(current_file)
         segy_file_path = self.get_segy_file_path(original_segy_file_name)
         with segyio.open(segy_file_path, "r", ignore_geometry=True) as segyfile:
-            indices = df["trace_index"].tolist()
-            amplitudes = [np.array(segyfile.trace[i]) for i in indices]
+            indices = df["trace_index"].to_numpy()
+            # Read only the span of traces covering the DataFrame rows, not the whole file
+            first = int(indices.min()) if len(indices) else 0
+            last = int(indices.max()) + 1 if len(indices) else 0
+            amplitudes = segyfile.trace.raw[first:last][indices - first]
         # Reset index to ensure proper alignment when assigning amplitudes
         df_result = df.reset_index(drop=True)
-        df_result["Amplitudes"] = amplitudes
+        df_result["Amplitudes"] = list(amplitudes)
         return df_result
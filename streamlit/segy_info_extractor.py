@@ -1,10 +1,15 @@
-import pandas as pd
+import io
 import numpy as np
 import segyio
+from dataclasses import dataclass
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from numba import njit
 from segysak.segy import get_segy_texthead
 from file_handler import FileHandler
 
-NAMES_EN = {
+# Read-only lookup tables; their identifier-like keys are interned by the compiler already
+NAMES_EN = MappingProxyType({
     "Interval": "sampling_rate",
     "Samples": "num_samples",
     "Format": "data_format",
@@ -12,9 +17,9 @@ NAMES_EN = {
     "SEGYRevision": "segy_revision",
     "SEGYRevisionMinor": "segy_revision_minor",
     "LineNumber": "line_number",
-}
+})
 
-READABLE_NAMES = {
+READABLE_NAMES = MappingProxyType({
     "sampling_rate": "Sampling Rate (ms)",
     "num_samples": "Samples per Trace",
     "data_format": "Data Format",
@@ -23,13 +28,141 @@ READABLE_NAMES = {
     "segy_revision_minor": "SEG-Y Revision (Minor)",
     "line_number": "Line Number",
     "data_type": "Data Type",
-}
+})
+
+# Trace header columns used by SegyInfoExtractor; the rest of the headers parquet is never decoded
+HEADER_COLUMNS = [
+    "SourceX",
+    "SourceY",
+    "CDP",
+    "INLINE_3D",
+    "CROSSLINE_3D",
+    "DelayRecordingTime",
+    "offset",
+    "TraceNumber",
+    "SourceGroupScalar",
+]
+
+# Header columns summarized by SegyInfoExtractor._compute_column_stats
+STATS_COLUMNS = [
+    "SourceX",
+    "SourceY",
+    "CDP",
+    "INLINE_3D",
+    "CROSSLINE_3D",
+    "DelayRecordingTime",
+    "offset",
+    "SourceGroupScalar",
+]
+
+# (name, field) pairs of the SEG-Y binary header, resolved once at import in dir() order.
+# The fields are the int-valued class attributes, which skips helpers such as BinField.enums
+_BIN_FIELDS = tuple(
+    (field_name, getattr(segyio.BinField, field_name))
+    for field_name in dir(segyio.BinField)
+    if not field_name.startswith("_") and isinstance(getattr(segyio.BinField, field_name), int)
+)
+
+
+@dataclass(slots=True)
+class ColStats:
+    min: float
+    max: float
+    first: float
+    last: float
+    sum: float
+
+
+@njit(cache=True)
+def scan_column(values):
+    """
+    Computes min, max, first, last and sum of a non-empty header column in a single pass.
+    """
+    minimum = values[0]
+    maximum = values[0]
+    total = 0.0
+    for value in values:
+        if value < minimum:
+            minimum = value
+        elif value > maximum:
+            maximum = value
+        total += value
+    return minimum, maximum, values[0], values[-1], total
+
+
+@njit(cache=True)
+def _count_unique_hashed(values):
+    """
+    Counts the distinct values of a non-empty array with a single hash-set pass instead of a sort.
+    """
+    seen = {values[0]}
+    for value in values:
+        seen.add(value)
+    return len(seen)
+
+
+def count_unique(values):
+    """
+    Counts the distinct values of an array. Integer arrays spanning a small range (such as channel numbers)
+    are counted with a presence table over that range; anything else goes through the hash-set kernel.
+    """
+    if values.size == 0:
+        return 0
+    if np.issubdtype(values.dtype, np.integer):
+        minimum = values.min()
+        if int(values.max()) - int(minimum) < 4 * values.size:
+            # Offsets in int64, since int8/int16 columns can overflow in their own dtype
+            return int(np.count_nonzero(np.bincount(values.astype(np.int64) - int(minimum))))
+    return _count_unique_hashed(values)
+
+
+def most_frequent_step(values):
+    """
+    Returns the most frequent absolute difference between consecutive values. The integer steps are
+    histogrammed with np.bincount, with steps of 4x the array length or more clamped into a single overflow
+    bin; only when that overflow bin wins does it fall back to a sort-based np.unique.
+    """
+    steps = np.abs(np.diff(values.astype(np.int64)))
+    overflow = 4 * steps.size
+    step = np.bincount(np.minimum(steps, overflow)).argmax()
+    if step == overflow:
+        step_values, step_counts = np.unique(steps, return_counts=True)
+        step = step_values[step_counts.argmax()]
+    return step
+
+
+def grid_spacing(sorted_values):
+    """
+    Returns the median spacing of sorted unique grid values. Equispaced grids, the usual case for inlines and
+    crosslines, return their constant step directly and skip the median's partial sort.
+    """
+    steps = np.diff(sorted_values)
+    if steps.size == 0:
+        return np.median(steps)
+    step = (sorted_values[-1] - sorted_values[0]) / steps.size
+    if np.all(steps == step):
+        return step
+    return np.median(steps)
+
 
 class SegyInfoExtractor:
     def __init__(self, segy_file_path: str, headers_file_name: str):
         self.segy_file_path = segy_file_path
         self.file_handler = FileHandler()
-        self.trace_headers = self.file_handler.read_parquet(f"{headers_file_name}.parquet")
+        trace_headers_df = self.file_handler.read_parquet(f"{headers_file_name}.parquet", columns=HEADER_COLUMNS)
+        # Header columns as plain NumPy arrays; every lookup afterwards is a dict access
+        self.trace_headers: dict[str, np.ndarray] = {
+            column: trace_headers_df[column].to_numpy() for column in trace_headers_df.columns
+        }
+        # Taken from the file metadata: when none of HEADER_COLUMNS survived the all-zero filter,
+        # the column-pruned read has no columns and therefore no rows
+        self._n = self.file_handler.get_parquet_row_count(f"{headers_file_name}.parquet")
+        # Shared fallback for every missing header column, hence read-only
+        self._zeros = np.zeros(self._n)
+        self._zeros.flags.writeable = False
+        self._column_stats: dict[str, ColStats] | None = None
+        self._il_unique = None
+        self._xl_unique = None
         self.is_3d = None
         self.info = None
         self.segyio_file = None
@@ -52,9 +185,11 @@ class SegyInfoExtractor:
 
     @staticmethod
     def format_number(value):
-        if isinstance(value, (np.floating, float)):
+        # Identity checks on the exact type first; the NumPy scalar types fall back to one issubclass each
+        value_type = type(value)
+        if value_type is float or issubclass(value_type, np.floating):
             return f"{float(value):.2f}".rstrip('0').rstrip('.')
-        if isinstance(value, (np.integer, int)):
+        if value_type is int or issubclass(value_type, np.integer):
             return int(value)
         return value
     
@@ -64,29 +199,27 @@ class SegyInfoExtractor:
         and stores only those that are present and contain valid data.
         """
         extracted_fields = {}
+        binary_header = self.segyio_file.bin
 
-        for field_name in dir(segyio.BinField):
-            # Ignore special (__dunder__) and private attributes
-            if field_name.startswith("_"):
-                continue
-            
-            try:
-                field = getattr(segyio.BinField, field_name)
-                value = self.segyio_file.bin[field]
-                
-                # Convert known field to friendly value if necessary
-                if field_name == "Interval":
-                    value = self.format_number(value / 1000)  # from µs to ms
-                
-                # Store if the value is considered valid
-                if value not in [None, 0]:
-                    name = NAMES_EN.get(field_name, field_name)
-                    extracted_fields[name] = value
+        # Fields segyio cannot read (the unassigned byte ranges) are not among its keys,
+        # so they are skipped up front instead of through a raised exception per field
+        readable_fields = {int(key) for key in binary_header.keys()}
 
-            except Exception:
-                # Field may not exist or be accessible in the binary header
+        for field_name, field in _BIN_FIELDS:
+            if int(field) not in readable_fields:
                 continue
 
+            value = binary_header[field]
+                
+            # Convert known field to friendly value if necessary
+            if field_name == "Interval":
+                value = self.format_number(value / 1000)  # from µs to ms
+            
+            # Store if the value is considered valid
+            if value not in [None, 0]:
+                name = NAMES_EN.get(field_name, field_name)
+                extracted_fields[name] = value
+
         # Add additional information
         extracted_fields["data_type"] = "3D" if self.is_3d else "2D"
 
@@ -94,31 +227,53 @@ class SegyInfoExtractor:
     
     def get_trace_header_value(self, key):
         """
-        Returns the value of the header column if it exists, otherwise returns an array of zeros of the same length.
+        Returns the values of the header column as a NumPy array if it exists, otherwise returns an array of zeros
+        of the same length.
         """
-        if key in self.trace_headers:
-            return self.trace_headers[key]
-        else:
-            return np.zeros(len(self.trace_headers))
-        
+        return self.trace_headers.get(key, self._zeros)
+
+    def _compute_column_stats(self) -> dict[str, ColStats]:
+        """
+        Summarizes every column in STATS_COLUMNS with one pass each. Missing columns are all zeros,
+        so their statistics are filled in without scanning.
+        """
+        column_stats = {}
+        for key in STATS_COLUMNS:
+            if key in self.trace_headers and self._n > 0:
+                column_stats[key] = ColStats(*scan_column(self.trace_headers[key]))
+            else:
+                column_stats[key] = ColStats(0, 0, 0, 0, 0)
+        return column_stats
+
+    def get_column_stats(self, key) -> ColStats:
+        """
+        Returns the precomputed statistics of a column in STATS_COLUMNS, computing all of them on first use.
+        """
+        if self._column_stats is None:
+            self._column_stats = self._compute_column_stats()
+        return self._column_stats[key]
+
     def extract_basic_info(self):
         """Extracts basic information using the already loaded headers"""
+        source_x_stats = self.get_column_stats('SourceX')
+
         info = {
-            "recording_time": self.format_number(self.get_trace_header_value('DelayRecordingTime').max() / 1000),
-            "shot_point_distance": self.format_number(abs(pd.Series(self.get_trace_header_value('SourceX')).diff().mode()[0])),
-            "plot_direction": "LR" if pd.Series(self.get_trace_header_value('SourceX')).diff().mean() > 0 else "RL",
-            "min_offset": self.format_number(self.get_trace_header_value('offset').min()),
-            "max_offset": self.format_number(self.get_trace_header_value('offset').max()),
-            "num_channels": self.format_number(len(pd.Series(self.get_trace_header_value('TraceNumber')).unique())),
-            "first_cdp": self.format_number(self.get_trace_header_value('CDP').min()),
-            "last_cdp": self.format_number(self.get_trace_header_value('CDP').max()),
+            "recording_time": self.format_number(self.get_column_stats('DelayRecordingTime').max / 1000),
+            "shot_point_distance": self.format_number(most_frequent_step(self.get_trace_header_value('SourceX'))),
+            # The mean step telescopes to (last - first) / (n - 1), so only its sign matters
+            "plot_direction": "LR" if source_x_stats.last > source_x_stats.first else "RL",
+            "min_offset": self.format_number(self.get_column_stats('offset').min),
+            "max_offset": self.format_number(self.get_column_stats('offset').max),
+            "num_channels": self.format_number(count_unique(self.get_trace_header_value('TraceNumber'))),
+            "first_cdp": self.format_number(self.get_column_stats('CDP').min),
+            "last_cdp": self.format_number(self.get_column_stats('CDP').max),
         }
         if self.is_3d:
             info.update({
-            "first_inline": self.format_number(self.get_trace_header_value('INLINE_3D').min()),
-            "last_inline": self.format_number(self.get_trace_header_value('INLINE_3D').max()),
-            "first_crossline": self.format_number(self.get_trace_header_value('CROSSLINE_3D').min()),
-            "last_crossline": self.format_number(self.get_trace_header_value('CROSSLINE_3D').max()),
+            "first_inline": self.format_number(self.get_column_stats('INLINE_3D').min),
+            "last_inline": self.format_number(self.get_column_stats('INLINE_3D').max),
+            "first_crossline": self.format_number(self.get_column_stats('CROSSLINE_3D').min),
+            "last_crossline": self.format_number(self.get_column_stats('CROSSLINE_3D').max),
             })
 
         return info
@@ -137,27 +292,30 @@ class SegyInfoExtractor:
         """Extracts geometry information using the already loaded headers"""
         geometry_info = {
             "total_traces": self.segyio_file.tracecount,  
-            "total_shots": len(np.unique(self.get_trace_header_value('SourceX'))),
+            "total_shots": count_unique(self.get_trace_header_value('SourceX')),
             "coordinates": {
-                "x_min": self.format_number(self.get_trace_header_value('SourceX').min()),
-                "x_max": self.format_number(self.get_trace_header_value('SourceX').max()),
-                "y_min": self.format_number(self.get_trace_header_value('SourceY').min()),
-                "y_max": self.format_number(self.get_trace_header_value('SourceY').max())
+                "x_min": self.format_number(self.get_column_stats('SourceX').min),
+                "x_max": self.format_number(self.get_column_stats('SourceX').max),
+                "y_min": self.format_number(self.get_column_stats('SourceY').min),
+                "y_max": self.format_number(self.get_column_stats('SourceY').max)
             }
         }
 
         if self.is_3d:
             geometry_info.update({
-                "inline_dimensions": len(np.unique(self.get_trace_header_value('INLINE_3D'))),
-                "crossline_dimensions": len(np.unique(self.get_trace_header_value('CROSSLINE_3D')))
+                "inline_dimensions": len(self._il_unique),
+                "crossline_dimensions": len(self._xl_unique)
             })
 
         return geometry_info
     
     def extract_acquisition_info(self):
         cdp_values = self.get_trace_header_value('CDP')
-        if np.std(cdp_values) != 0:
-            fold = pd.Series(cdp_values).groupby(cdp_values).size()
+        cdp_stats = self.get_column_stats('CDP')
+        # Non-zero standard deviation, i.e. not every CDP is the same
+        if cdp_stats.max != cdp_stats.min:
+            # Number of traces per CDP
+            fold = np.unique(cdp_values, return_counts=True)[1]
             acq_info = {
                 "average_fold": self.format_number(fold.mean()),
                 "maximum_fold": self.format_number(fold.max()),
@@ -171,12 +329,10 @@ class SegyInfoExtractor:
             }
         
         if self.is_3d:
-            il_spacing = np.diff(np.sort(np.unique(self.get_trace_header_value('INLINE_3D'))))
-            xl_spacing = np.diff(np.sort(np.unique(self.get_trace_header_value('CROSSLINE_3D'))))
-            
+            # np.unique output is already sorted
             acq_info.update({
-                "inline_spacing": self.format_number(np.median(il_spacing)),
-                "crossline_spacing": self.format_number(np.median(xl_spacing))
+                "inline_spacing": self.format_number(grid_spacing(self._il_unique)),
+                "crossline_spacing": self.format_number(grid_spacing(self._xl_unique))
             })
             
         return acq_info
@@ -185,13 +341,30 @@ class SegyInfoExtractor:
         """
         Extracts all information within the context of the 'with' manager
         """
-        with self:
+        # The executor is entered last so it joins its workers before self closes the segyio file
+        with self, ThreadPoolExecutor(max_workers=5) as executor:
+            # The textual header read does not depend on anything below, so start it first
+            ascii_header_future = executor.submit(get_segy_texthead, self.segy_file_path)
+
+            # Shared state is filled in before the workers start, so they only read it
+            self._column_stats = self._compute_column_stats()
+            if self.is_3d:
+                # Sorted once here and reused for both the grid dimensions and the spacing
+                self._il_unique = np.unique(self.get_trace_header_value('INLINE_3D'))
+                self._xl_unique = np.unique(self.get_trace_header_value('CROSSLINE_3D'))
+
+            # The extractions touch disjoint, read-only data and run concurrently
+            basic_future = executor.submit(self.extract_basic_info)
+            binary_header_future = executor.submit(self.extract_binary_header_info)
+            geometry_future = executor.submit(self.extract_geometry_info)
+            acquisition_future = executor.submit(self.extract_acquisition_info)
+
             self.info = {
-                "basic_information": self.extract_basic_info(),
-                "binary_header": self.extract_binary_header_info(),
-                "geometry": self.extract_geometry_info(),
-                "acquisition": self.extract_acquisition_info(),
-                "ascii_header_text": get_segy_texthead(self.segy_file_path)
+                "basic_information": basic_future.result(),
+                "binary_header": binary_header_future.result(),
+                "geometry": geometry_future.result(),
+                "acquisition": acquisition_future.result(),
+                "ascii_header_text": ascii_header_future.result()
             }
 
         information = self.get_segy_info_text()
@@ -208,52 +381,51 @@ class SegyInfoExtractor:
         acq = self.info["acquisition"]
         ASCII_header = self.info["ascii_header_text"]
     
-        info = (
-            "DETAILED INFORMATION OF THE SEG-Y FILE\n"
-            "INFORMATION CONTAINED IN THE ASCII HEADER:\n"
-            f"ASCII_header: {ASCII_header}"
-            
-            "BASIC INFORMATION:\n"
-            f"Recording Time: {basic['recording_time']} s\n"
-            f"Distance Between Shot Points: {basic['shot_point_distance']} m\n"
-            f"Plot Direction: {basic['plot_direction']}\n"
-            f"Offset Range: {basic['min_offset']} - {basic['max_offset']} m\n"
-            f"Number of Channels: {basic['num_channels']}\n"
-            f"CDP Range: {basic['first_cdp']} - {basic['last_cdp']}\n"
-            
-            "\nBINARY HEADER INFORMATION:\n"
-            f"{binary_header_info}"
-
-            "\nGEOMETRY INFORMATION:\n"
-            f"Total Traces: {geo['total_traces']}\n"
-            f"Total Shots: {geo['total_shots']}\n"
-            "Coordinates:\n"
-            f"  X: {geo['coordinates']['x_min']} - {geo['coordinates']['x_max']}\n"
-            f"  Y: {geo['coordinates']['y_min']} - {geo['coordinates']['y_max']}\n"
-            
-            "\nACQUISITION INFORMATION:\n"
-            f"Average Fold: {acq['average_fold']}\n"
-            f"Maximum Fold: {acq['maximum_fold']}\n"
-            f"Minimum Fold: {acq['minimum_fold']}\n"
-        )
-    
+        # 3D files get the CDP range values on their own line
+        cdp_separator = "\n" if self.is_3d else ""
+
+        buf = io.StringIO()
+        buf.write("DETAILED INFORMATION OF THE SEG-Y FILE\n")
+        buf.write("INFORMATION CONTAINED IN THE ASCII HEADER:\n")
+        buf.write(f"ASCII_header: {ASCII_header}")
+
+        buf.write("BASIC INFORMATION:\n")
+        buf.write(f"Recording Time: {basic['recording_time']} s\n")
+        buf.write(f"Distance Between Shot Points: {basic['shot_point_distance']} m\n")
+        buf.write(f"Plot Direction: {basic['plot_direction']}\n")
+        buf.write(f"Offset Range: {basic['min_offset']} - {basic['max_offset']} m\n")
+        buf.write(f"Number of Channels: {basic['num_channels']}\n")
+        buf.write(f"CDP Range:{cdp_separator} {basic['first_cdp']} - {basic['last_cdp']}\n")
+
+        buf.write("\nBINARY HEADER INFORMATION:\n")
+        buf.write(binary_header_info)
+
+        buf.write("\nGEOMETRY INFORMATION:\n")
+        buf.write(f"Total Traces: {geo['total_traces']}\n")
+        buf.write(f"Total Shots: {geo['total_shots']}\n")
+        buf.write("Coordinates:\n")
+        buf.write(f"  X: {geo['coordinates']['x_min']} - {geo['coordinates']['x_max']}\n")
+        buf.write(f"  Y: {geo['coordinates']['y_min']} - {geo['coordinates']['y_max']}\n")
+
+        buf.write("\nACQUISITION INFORMATION:\n")
+        buf.write(f"Average Fold: {acq['average_fold']}\n")
+        buf.write(f"Maximum Fold: {acq['maximum_fold']}\n")
+        buf.write(f"Minimum Fold: {acq['minimum_fold']}\n")
+
         if self.is_3d:
-            info = info.replace("CDP Range:", "CDP Range:\n")
-            info += (
-                f"Inline Range: {basic['first_inline']} - {basic['last_inline']}\n"
-                f"Crossline Range: {basic['first_crossline']} - {basic['last_crossline']}\n"
-                f"Inline Dimensions: {geo['inline_dimensions']}\n"
-                f"Crossline Dimensions: {geo['crossline_dimensions']}\n"
-                f"Inline Spacing: {acq['inline_spacing']}\n"
-                f"Crossline Spacing: {acq['crossline_spacing']}\n"
-            )
-    
-        return info
+            buf.write(f"Inline Range: {basic['first_inline']} - {basic['last_inline']}\n")
+            buf.write(f"Crossline Range: {basic['first_crossline']} - {basic['last_crossline']}\n")
+            buf.write(f"Inline Dimensions: {geo['inline_dimensions']}\n")
+            buf.write(f"Crossline Dimensions: {geo['crossline_dimensions']}\n")
+            buf.write(f"Inline Spacing: {acq['inline_spacing']}\n")
+            buf.write(f"Crossline Spacing: {acq['crossline_spacing']}\n")
+
+        return buf.getvalue()
 
     def extract_scaling_factor(self):
         """
         Extracts the source group scalar.
         """
-        scalar = self.get_trace_header_value('SourceGroupScalar').mean()
+        scalar = self.get_column_stats('SourceGroupScalar').sum / self._n
         scalar = self.format_number(scalar)
         return scalar if scalar != 0 else 1
@@ -0,0 +1,217 @@
+import numpy as np
+import plotly.graph_objects as go
+import matplotlib.pyplot as plt
+from numba import njit, prange
+from scipy.ndimage import zoom
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def normalize_to_u8(amplitudes, out):
+    """
+    Normalizes the amplitudes by their peak absolute value and writes them to out as uint8 color indices,
+    mapping -peak to 0 and +peak to 255. Both passes run in parallel across traces.
+    """
+    n_traces, n_samples = amplitudes.shape
+
+    # Per-trace peaks, so the parallel loop has no shared reduction variable
+    trace_peaks = np.zeros(n_traces)
+    for i in prange(n_traces):
+        trace_peak = 0.0
+        for j in range(n_samples):
+            value = abs(amplitudes[i, j])
+            if value > trace_peak:
+                trace_peak = value
+        trace_peaks[i] = trace_peak
+
+    peak = trace_peaks.max()
+    scale = 127.5 / peak if peak > 0 else 0.0
+    for i in prange(n_traces):
+        for j in range(n_samples):
+            index = amplitudes[i, j] * scale + 127.5
+            out[i, j] = np.uint8(min(max(index, 0.0), 255.0))
+
+
+# Serial variant for callers on several threads at once (such as Streamlit sessions): Numba's default
+# workqueue threading layer aborts the process when two threads enter a parallel kernel at once
+@njit(fastmath=True, cache=True)
+def normalize_to_u8_serial(amplitudes, out):
+    """
+    Same as normalize_to_u8, without parallel loops.
+    """
+    n_traces, n_samples = amplitudes.shape
+
+    peak = 0.0
+    for i in range(n_traces):
+        for j in range(n_samples):
+            value = abs(amplitudes[i, j])
+            if value > peak:
+                peak = value
+
+    scale = 127.5 / peak if peak > 0 else 0.0
+    for i in range(n_traces):
+        for j in range(n_samples):
+            index = amplitudes[i, j] * scale + 127.5
+            out[i, j] = np.uint8(min(max(index, 0.0), 255.0))
+
+
+def build_colorscale(colormap: str) -> tuple:
+    """
+    Returns the read-only uint8 RGB lookup table (256 x 3) and the Plotly colorscale for a matplotlib colormap.
+    The colormap is evaluated once for all 256 levels; the table also colors the image path.
+    Callers cache the result per colormap.
+    """
+    cmap = plt.get_cmap(colormap)
+    scale_values = np.linspace(0, 1, 256)
+    lut = (cmap(scale_values)[:, :3] * 255).astype(np.uint8)
+    lut.flags.writeable = False # Shared by every caller through their cache
+    colorscale = tuple(
+        (value, f"rgb({r}, {g}, {b})")
+        for value, (r, g, b) in zip(scale_values.tolist(), lut.tolist())
+    )
+    return lut, colorscale
+
+
+def build_wiggle_trace(amplitudes, trace_positions, time_samples, height_px: int) -> go.Scattergl:
+    """
+    Builds all wiggle traces as a single WebGL line, with traces separated by NaN gaps. Traces longer than
+    2 * height_px samples are reduced to the min/max envelope of height_px equal time buckets (2 * height_px
+    points); shorter traces are drawn sample by sample.
+    """
+    n_traces, n_samples = amplitudes.shape
+
+    if n_samples <= 2 * height_px:
+        # The envelope would not have fewer points than the trace itself
+        points = np.empty((n_traces, n_samples + 1), dtype=np.float32)
+        points[:, :-1] = amplitudes
+        point_times = time_samples[:n_samples]
+    else:
+        bucket_starts = np.linspace(0, n_samples, height_px, endpoint=False).astype(np.intp)
+        points = np.empty((n_traces, 2 * height_px + 1), dtype=np.float32)
+        points[:, 0:-1:2] = np.minimum.reduceat(amplitudes, bucket_starts, axis=1)
+        points[:, 1:-1:2] = np.maximum.reduceat(amplitudes, bucket_starts, axis=1)
+        point_times = np.repeat(time_samples[bucket_starts], 2)
+    points[:, -1] = np.nan
+
+    # Scale so the largest excursion reaches the neighbouring trace
+    peak = max(amplitudes.max(), -amplitudes.min())
+    spacing = trace_positions[1] - trace_positions[0] if n_traces > 1 else 1
+    x = trace_positions[:n_traces, np.newaxis] + points * (spacing / peak if peak > 0 else 0)
+
+    y = np.empty(points.shape[1], dtype=np.float32)
+    y[:-1] = point_times
+    y[-1] = np.nan
+
+    return go.Scattergl(
+        x=x.ravel(),
+        y=np.tile(y, n_traces),
+        mode="lines",
+        line=dict(color="black", width=0.5),
+        hoverinfo="skip",
+        showlegend=False,
+    )
+
+
+def build_section_figure(
+    amplitudes,
+    trace_number,
+    time_samples,
+    dt_ms: float,
+    lut,
+    colorscale,
+    color_title: str,
+    show_seismic: bool,
+    parallel: bool = True,
+) -> go.Figure:
+    """
+    Builds the seismic section figure (without its layout) from a (traces, samples) amplitude matrix.
+
+    Parameters:
+      amplitudes (np.ndarray): The amplitudes of each trace.
+      trace_number (np.ndarray): The trace number of each row of amplitudes, used for the x axis.
+      time_samples (np.ndarray): The time of each sample in seconds, used for the y axis.
+      dt_ms (float): The sample interval in milliseconds.
+      lut (np.ndarray), colorscale (tuple): The colormap, as returned by build_colorscale.
+      color_title (str): The colorbar title.
+      show_seismic (bool): Whether to draw wiggle traces over the section.
+      parallel (bool): Whether to normalize with the parallel kernel; pass False when called from several
+             threads at once.
+
+    Returns:
+      go.Figure: A go.Image (large sections) or go.Heatmap of the section, colored by amplitude.
+    """
+    # 8 bits per cell are enough to render a colormap, so both render paths ship uint8 color indices
+    amplitudes = amplitudes.astype(np.float32, copy=False)
+    color_index = np.empty(amplitudes.shape, dtype=np.uint8)
+    if parallel:
+        normalize_to_u8(amplitudes, color_index)
+    else:
+        normalize_to_u8_serial(amplitudes, color_index)
+
+    # Keep about one trace per pixel column of the figure; the rest would never be drawn
+    trace_stride = max(1, color_index.shape[0] // 700)
+    color_index = color_index[::trace_stride]
+
+    colorbar = dict(
+        title=color_title,
+        tickfont=dict(size=14),
+        thickness=30,
+        len=1,
+    )
+
+    if color_index.size > 10_000:
+        # Large sections: apply the colormap in NumPy and ship a compact uint8 RGB image
+        # instead of letting plotly.js interpolate the full z-matrix
+        section = color_index.T
+
+        # Bilinear interpolation done once at the figure's resolution (equivalent to Seismic Unix Ximage),
+        # so the browser only has to draw the image on every pan and zoom
+        image_height, image_width = 500, 700
+        smoothed = zoom(section, (image_height / section.shape[0], image_width / section.shape[1]), order=1)
+
+        fig = go.Figure(data=go.Image(
+            z=lut[smoothed],
+            x0=trace_number[0],
+            dx=(section.shape[1] - 1) * trace_stride / max(smoothed.shape[1] - 1, 1),
+            y0=0,
+            dy=(section.shape[0] - 1) * dt_ms / 1000 / max(smoothed.shape[0] - 1, 1),
+            colormodel="rgb",
+            hoverinfo="x+y",
+        ))
+
+        # go.Image has no colorbar, so draw it from an empty marker trace
+        fig.add_trace(go.Scatter(
+            x=[None],
+            y=[None],
+            mode="markers",
+            showlegend=False,
+            marker=dict(
+                colorscale=colorscale,
+                cmin=-1,
+                cmax=1,
+                color=[0],
+                showscale=True,
+                colorbar=colorbar,
+            )
+        ))
+    else:
+        fig = go.Figure(data=go.Heatmap(
+            z=color_index.T,
+            x=trace_number[::trace_stride],
+            y=time_samples,
+            colorscale=colorscale,
+            zsmooth='best', # Applies bilinear interpolation for smoother visualization (equivalent to Seismic Unix Ximage)
+            zmin=0,
+            zmax=255,
+            colorbar=dict(
+                colorbar,
+                tickvals=np.linspace(0, 255, 5),
+                ticktext=["-1", "-0.5", "0", "0.5", "1"],
+            ),
+        ))
+
+    if show_seismic:
+        # Wiggle traces over the section, reduced to an envelope at the figure's pixel height
+        fig.add_trace(build_wiggle_trace(
+            amplitudes[::trace_stride], trace_number[::trace_stride], time_samples, 500))
+
+    return fig